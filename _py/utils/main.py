@@ -1,6 +1,7 @@
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.expanduser("../utils"))
 from website_utils import update_citations, append_metadata
 
@@ -22,35 +23,56 @@ def main():
 
     # Define file paths
     metadata_file = os.path.join(args.directory, "articles-metadata.csv")
-    log_file = os.path.join(args.directory, "update-log.json")
     pmid_file = os.path.join(args.directory, "PMID-export.txt")
 
-    # Validate file existence
-    if not os.path.exists(metadata_file):
-        parser.error(f"Metadata file not found: {metadata_file}")
-    if not os.path.exists(log_file):
-        parser.error(f"Log file not found: {log_file}")
-    if (args.append_metadata or args.update_and_append) and not os.path.exists(pmid_file):
-        parser.error(f"PMID file not found: {pmid_file}")
+    # Validate file existence with a single directory scan instead of one
+    # stat call per file, reporting all missing files at once.
+    try:
+        entries = {entry.name for entry in os.scandir(args.directory)}
+    except FileNotFoundError:
+        parser.error(f"Directory not found: {args.directory}")
+    except NotADirectoryError:
+        parser.error(f"Not a directory: {args.directory}")
+    required = {"articles-metadata.csv", "update-log.json"}
+    if args.append_metadata or args.update_and_append:
+        required.add("PMID-export.txt")
+    missing = sorted(required - entries)
+    if missing:
+        parser.error(f"Required file(s) not found in {args.directory}: {', '.join(missing)}")
 
     success_messages = []
     error_messages = []
 
-    if args.update_citations or args.update_and_append:
-        success, message = update_citations(metadata_file, verbose=not args.quiet)
+    def record_result(operation: str, success: bool, message: str):
         if success:
-            success_messages.append(f"Update citations operation: {message}")
+            success_messages.append(f"{operation}: {message}")
         else:
-            error_messages.append(f"Update citations operation completed without saving new data: {message}")
+            error_messages.append(f"{operation} completed without saving new data: {message}")
 
-    if args.append_metadata or args.update_and_append:
-        success, message = append_metadata(metadata_file, pmid_file, 
-                                           exclude_errata=not args.include_errata, 
+    if args.update_and_append:
+        # Both operations spend most of their time waiting on the OpenAlex
+        # API, so run them concurrently. Writes to the shared metadata file
+        # are serialized inside website_utils. Each operation gets half the
+        # 600/min polite-pool budget, since each thread paces its own API
+        # calls and the limit applies to the process as a whole.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            update_future = executor.submit(update_citations, metadata_file,
+                                            rate_per_minute=300,
+                                            verbose=not args.quiet)
+            append_future = executor.submit(append_metadata, metadata_file, pmid_file,
+                                            exclude_errata=not args.include_errata,
+                                            rate_per_minute=300,
+                                            verbose=not args.quiet)
+            record_result("Update citations operation", *update_future.result())
+            record_result("Append metadata operation", *append_future.result())
+    elif args.update_citations:
+        success, message = update_citations(metadata_file, verbose=not args.quiet)
+        record_result("Update citations operation", success, message)
+    elif args.append_metadata:
+        success, message = append_metadata(metadata_file, pmid_file,
+                                           exclude_errata=not args.include_errata,
                                            verbose=not args.quiet)
-        if success:
-            success_messages.append(f"Append metadata operation: {message}")
-        else:
-            error_messages.append(f"Append metadata operation completed without saving new data: {message}")
+        record_result("Append metadata operation", success, message)
 
     # Print results
     for message in success_messages:
@@ -2,12 +2,81 @@ import os
 from pathlib import Path
 import re
 import json
+import threading
 import time
-from datetime import datetime, timedelta
-import requests 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlencode
 from tqdm import tqdm
 
+# Shared session for all OpenAlex calls: keep-alive avoids a TCP+TLS
+# handshake per request, and the urllib3 retry policy backs off on rate
+# limiting and transient server errors instead of failing the call.
+# When requests-cache is installed, API responses are additionally served
+# from an on-disk sqlite cache, with OpenAlex's own ETag/Cache-Control
+# headers driving revalidation via cheap conditional GETs. Only
+# api.openalex.org responses are cached — PDF downloads stay uncached.
+try:
+    from requests_cache import CachedSession, DO_NOT_CACHE
+    _SESSION = CachedSession(
+        os.path.expanduser("~/.cache/openalex-requests"),
+        backend="sqlite",
+        cache_control=True,
+        expire_after=86400,
+        allowable_codes=(200,),
+        stale_if_error=True,
+        urls_expire_after={"api.openalex.org/*": 86400, "*": DO_NOT_CACHE},
+    )
+except ImportError:
+    _SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+
+class _RateLimiter:
+    """Thread-safe token bucket pacing calls to the OpenAlex rate limit.
+
+    Each acquire() reserves the next free send slot and sleeps until it
+    arrives, spacing requests evenly at `rate` per second instead of
+    bursting ten calls and then stalling for the rest of the second.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(self._next_slot, now) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+_RATE_LIMITER = _RateLimiter(rate=10)  # OpenAlex allows 10 requests per second.
+
+def _api_get(url: str, params: Optional[Dict[str, Any]] = None, timeout: int = 10) -> requests.Response:
+    """Single entry point for OpenAlex API GETs on the shared session.
+
+    Every metadata fetch (works, citation pages) goes through here, so
+    session-wide concerns like pooling, retries, caching, and rate
+    limiting apply uniformly. PDF downloads stream and use the session
+    directly.
+    """
+    _RATE_LIMITER.acquire()
+    return _SESSION.get(url, params=params, timeout=timeout)
+
 def get_works(ids: list, email: str, 
         select_fields: str = (
         "id,doi,title,authorships,publication_year,publication_date,ids,"
@@ -111,19 +180,21 @@ def get_works(ids: list, email: str,
             f"Ensure you have the right to download and use the content.\n"
             )
 
-    # Initialize variables used for the API request and function
+    # Initialize variables used for the API request and function.
+    # The query string is identical for every call in the loop, so encode
+    # it once here instead of letting requests re-encode the params dict
+    # per request.
     base_url = "https://api.openalex.org/works/"
-    params = {
+    query_string = "?" + urlencode({
         "mailto": email,
         "select": select_fields,
-    }
-        
+    })
+
+
     works = []
     failed_calls = []
     doi_regex = r"10.\d{1,9}/[-._;()/:A-Za-z0-9]+" 
     todays_date = datetime.now().date()
-    now = datetime.now()
-    iter_count = 0
 
     # Display a progress bar if show_progress is True
     if show_progress:
@@ -162,7 +233,10 @@ def get_works(ids: list, email: str,
                 _pmid = _work["metadata"]["ids"]["pmid"] if "pmid" in _work["metadata"]["ids"] else None
                 if id == _uid or id == _doi or id == _pmid:
                     persist_datetime = _work["persist_datetime"]
-                    if (todays_date - datetime.strptime(persist_datetime, "%Y-%m-%dT%H:%M:%S.%f").date()).days < 30:
+                    # fromisoformat parses the stored ISO-8601 timestamp much
+                    # faster than strptime, which recompiles its format string
+                    # on every call in this loop.
+                    if (todays_date - datetime.fromisoformat(persist_datetime).date()).days < 30:
                         if verbose: print(f"Data for UID {id} already exists in cache. Skipping retrieval...")
                         status_message += f"{todays_date}: Data for UID {id} already exists in {persist_dir}. Skipped. "
                         works.append(_work)
@@ -177,18 +251,8 @@ def get_works(ids: list, email: str,
                 # TODO: This may require revision. 
                 # If the metadata were persisted, the PDF file may not have been saved.
 
-        # The following block of code is used to handle the API rate limit. 
-        # The OpenAlex API has a rate limit of 10 requests per second.
-        if iter_count > 9:
-            time_delta = datetime.now() - now 
-            if time_delta < timedelta(seconds=1): 
-                remaining_time = 1 - time_delta.total_seconds()
-                if verbose: print(f"Number of requests reached 10. Sleeping for {round(remaining_time, 3)} seconds...")
-                time.sleep(remaining_time)
-                iter_count = 0
-                now = datetime.now()
-
         # Construct the URL for the API call based on the ID type.
+        # Rate limiting is handled by the token bucket inside _api_get.
         if re.match(doi_regex, id):
             url = f"{base_url}https://doi.org/{id}"
         elif id.isdigit():
@@ -203,8 +267,8 @@ def get_works(ids: list, email: str,
             continue # Skip to the next iteration if the ID is invalid.
 
         # Retrieve data for the work from the API.
-        try: 
-            response = requests.get(url, params=params)    
+        try:
+            response = _api_get(url + query_string)
         except requests.RequestException as e:
             if verbose: print(f"An error occurred while making an API call with UID {id}: {e}")
             failed_calls.append({"uid": id, "error": f"Exception during API call: {e}"})
@@ -274,9 +338,6 @@ def get_works(ids: list, email: str,
         # Append the work data to the works list.
         works.append(work)
 
-        # Increment the iteration counter.
-        iter_count += 1
-        
     if verbose: print("***\nFinished retrieving works.\n")
 
     return works, failed_calls
@@ -328,19 +389,16 @@ def download_pdf(data: dict, pdf_output_dir: str, email: str,
     if not os.path.exists(pdf_output_dir):
         os.makedirs(pdf_output_dir)
 
-    # Extract the OpenAlex ID, PMID and DOI from the data dictionary. 
+    # Extract the OpenAlex ID, PMID and DOI from the data dictionary.
     # This is used to generate a unique filename for the PDF file to be saved.
+    # Look up the 'ids' sub-dictionary once and reuse it for every
+    # identifier instead of re-traversing data['ids'] per lookup.
     oaid = data['id'].split('/')[-1]
-    try:
-        pmid = data['ids'].get('pmid', '?').split('/')[-1]
-    except KeyError:
-        pmid = "?"
-    try:
-        doi = data['ids'].get('doi', '')
-        if doi.startswith("https://doi.org/"):
-            doi = doi.replace("https://doi.org/", "").replace("/", "#")
-    except KeyError:
-        doi = "?"
+    ids = data.get('ids') or {}
+    pmid = ids.get('pmid', '?').split('/')[-1]
+    doi = ids.get('doi', '')
+    if doi.startswith("https://doi.org/"):
+        doi = doi.replace("https://doi.org/", "").replace("/", "#")
     
     pdf_filename = f"{pmid}_{doi}_{oaid}.pdf"
     pdf_filepath = os.path.join(pdf_output_dir, pdf_filename)
@@ -373,7 +431,7 @@ def download_pdf(data: dict, pdf_output_dir: str, email: str,
     if verbose:
         print(f"Trying to download PDF from {pdf_url}...")
     try:
-        pdf_response = requests.get(pdf_url, params={"mailto": email}, stream=True)
+        pdf_response = _SESSION.get(pdf_url, params={"mailto": email}, stream=True, timeout=30)
     except requests.RequestException as e:
         if verbose:
             print(f"An error occurred while attempting to download {data['id']} from {pdf_url}: {e}")
@@ -422,7 +480,7 @@ def download_pdf(data: dict, pdf_output_dir: str, email: str,
                 print(f"Failed to download from {pdf_url}. Status code: {pdf_response.status_code}. Trying with Selenium...")
             # Try using selenium to download the PDF
             # First, try to download PDF using Selenium and the PubMed Central URL if available.
-            pmcid = data.get('ids', {}).get('pmcid', None)
+            pmcid = ids.get('pmcid', None)
             if pmcid:
                 pmcid = f"PMC{pmcid.split('/')[-1]}"
                 pmc_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/pdf/"
@@ -639,21 +697,16 @@ def persist_data_to_disk(work: dict, persist_dir: str) -> bool:
     if not os.path.exists(persist_dir): 
         os.makedirs(persist_dir)
 
-    # Extract the OpenAlex ID, PMID and DOI from the metadata. 
+    # Extract the OpenAlex ID, PMID and DOI from the metadata.
     # This is used to generate unique filenames for the JSON files.
-    oaid = work['metadata']['id'].split('/')[-1] 
-    try:
-        pmid = work['metadata']['ids'].get('pmid', '?').split('/')[-1] # Extract the PMID from the metadata. The try-except block is used to handle cases where the 'ids' key is not present.
-    except Exception:
-        pmid = "?"
-    try:
-        doi = work['metadata']['ids'].get('doi', '?') # Extract the DOI from the metadata. The try-except block is used to handle cases where the 'ids' key is not present.
-        if doi.startswith("https://doi.org/"):
-            doi = doi.replace("https://doi.org/", "") # Remove the prefix from the DOI.
-            doi = doi.replace("/", "#") # Replace the forward slash with a hash symbol to avoid issues with file paths.
-        # print(doi) # Uncomment this line for debugging
-    except Exception:
-        doi = "?"
+    # Look up the 'ids' sub-dictionary once; it may be absent.
+    oaid = work['metadata']['id'].split('/')[-1]
+    ids = work['metadata'].get('ids') or {}
+    pmid = ids.get('pmid', '?').split('/')[-1]
+    doi = ids.get('doi', '?')
+    if doi.startswith("https://doi.org/"):
+        doi = doi.replace("https://doi.org/", "") # Remove the prefix from the DOI.
+        doi = doi.replace("/", "#") # Replace the forward slash with a hash symbol to avoid issues with file paths.
 
     # Update the 'persist_datetime' field in the work dictionary.
     work["persist_datetime"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%f")
@@ -772,6 +825,24 @@ def get_citations(works: List[Dict[str, Any]], email: str, per_page: int = 200,
     else:
         iterable = works
 
+    # Encode the constant part of the query once; only the page number
+    # changes between calls. cited_by_api_url already carries a filter
+    # query, so extra parameters are joined with '&'.
+    base_query = urlencode({"mailto": email, "per_page": per_page})
+
+    def fetch_citations_page(url: str, page: int) -> List[Dict[str, Any]]:
+        sep = "&" if "?" in url else "?"
+        try:
+            response = _api_get(f"{url}{sep}{base_query}&page={page}")
+            if response.status_code == 200:
+                return response.json()['results']
+            if verbose:
+                print(f"API call failed with status code {response.status_code}.")
+        except requests.RequestException as e:
+            if verbose:
+                print(f"An error occurred while making an API call: {e}")
+        return []
+
     # Iterate over each work in the list to retrieve the works that cite them.
     for work in iterable:
         if not isinstance(work, dict) or 'metadata' not in work or 'cited_by_count' not in work['metadata']:
@@ -780,20 +851,17 @@ def get_citations(works: List[Dict[str, Any]], email: str, per_page: int = 200,
         cited_by_count = work['metadata']['cited_by_count']
         short_title = work['metadata']['title'][:50] + "..." if len(work['metadata']['title']) > 50 else work['metadata']['title']
         if cited_by_count != 0:
-            cited_by_batches = [cited_by_count - i for i in range(0, cited_by_count, per_page)]
-            for i, batch in enumerate(cited_by_batches):
-                if verbose:
-                    print(f"Processing batch {i+1} of {len(cited_by_batches)} ({cited_by_count} citations) for '{short_title}' from {work['metadata']['cited_by_api_url']} ...")
-                try:
-                    response = requests.get(work['metadata']['cited_by_api_url'], params={"mailto": email, "per_page": per_page, "page": i+1})
-                    if response.status_code == 200:
-                        citations_metadata.extend(response.json()['results'])
-                    else:
-                        if verbose:
-                            print(f"API call failed with status code {response.status_code}.")
-                except requests.RequestException as e:
-                    if verbose:
-                        print(f"An error occurred while making an API call: {e}")
+            # The page count is known upfront from cited_by_count, so fetch
+            # all pages concurrently instead of waiting on each response
+            # before requesting the next; executor.map keeps page order.
+            num_pages = -(-cited_by_count // per_page)
+            if verbose:
+                print(f"Fetching {num_pages} page(s) ({cited_by_count} citations) for '{short_title}' from {work['metadata']['cited_by_api_url']} ...")
+            with ThreadPoolExecutor(max_workers=min(8, num_pages)) as executor:
+                for results in executor.map(fetch_citations_page,
+                                            [work['metadata']['cited_by_api_url']] * num_pages,
+                                            range(1, num_pages + 1)):
+                    citations_metadata.extend(results)
 
     # Display a progress bar if show_progress is True
     if show_progress:
@@ -1,16 +1,90 @@
 import os
 import json
+import shutil
+import threading
 from typing import Tuple, Set, List, Dict, Any
-from copy import deepcopy
 from datetime import datetime
+from pathlib import Path
 import pandas as pd
-from openalex_api_lite import get_works
+from openalex_api_lite import get_works, CITATION_FIELDS
+
+# orjson serializes faster than the stdlib json module; fall back to the
+# stdlib when not installed. Only used for the small update-log payload.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializes read-modify-write access to the metadata CSV so update_citations
+# and append_metadata can run concurrently (see main.py --update-and-append)
+# without overwriting each other's changes. The API calls stay outside the
+# lock; only the file mutation is serialized.
+_METADATA_FILE_LOCK = threading.Lock()
+
+def _read_metadata_csv(file_path: str) -> pd.DataFrame:
+    """Read the metadata CSV as strings.
+
+    Always uses the default C engine: the pyarrow engine infers
+    updated_date as a timestamp before the str cast, reformatting the
+    ISO "T" separator to a space and churning the git-tracked file on the
+    next write. At ~80 rows the parser speed difference is irrelevant.
+    """
+    return pd.read_csv(file_path, dtype=str)
+
+def _write_metadata_csv(metadata: pd.DataFrame, file_path: str) -> None:
+    """Write the metadata CSV atomically.
+
+    Serializes into a sibling temp file that is moved over the target with
+    os.replace, so readers — and hardlinked backups of the previous version —
+    never observe a truncated file. Always uses DataFrame.to_csv: the file is
+    committed to git and consumed by Jekyll, and Arrow's CSV writer quotes
+    every string cell, which would rewrite the whole artifact in a different
+    format (and flip-flop between environments with and without pyarrow).
+    """
+    tmp_path = f"{file_path}.tmp"
+    metadata.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, file_path)
+
+def _touch_log(log_file_path: str | os.PathLike, status_message: str | None = None) -> None:
+    """Stamp the update log with today's date, atomically.
+
+    When called without a status_message, the one already on disk is kept
+    rather than dropped. The payload is serialized in one go and moved into
+    place with os.replace, ensuring a crash mid-write can never leave a
+    truncated log behind.
+    """
+    try:
+        with open(log_file_path, "rb") as f:
+            existing = f.read()
+    except OSError:
+        existing = b""
+    if status_message is None and existing:
+        # A date-only stamp (e.g. from append_metadata) must not drop the
+        # last recorded status_message; carry it over from the current log.
+        try:
+            previous = orjson.loads(existing) if orjson else json.loads(existing)
+            status_message = previous.get("status_message")
+        except ValueError:
+            pass
+    log_data: Dict[str, str] = {"last_modified": datetime.now().strftime("%Y-%m-%d")}
+    if status_message is not None:
+        log_data["status_message"] = status_message
+    payload = orjson.dumps(log_data) if orjson else json.dumps(log_data, separators=(",", ":")).encode()
+    # Skip the write (and the resulting inode churn) when the log already
+    # holds exactly this payload, e.g. on repeated same-day runs.
+    if existing == payload:
+        return
+    tmp_path = f"{log_file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, log_file_path)
 
 def update_citations(
     file_path: str,
     save_metadata_to_disk: bool = True,
     save_backup: bool = True,
-    save_log_file: bool = True, 
+    save_log_file: bool = True,
+    rate_per_minute: int = 600,
     verbose: bool = True
 ) -> Tuple[bool, str]:
     """
@@ -21,6 +95,7 @@ def update_citations(
         save_metadata_to_disk (bool): Whether to save the updated metadata to disk. Default is True. Set to False for testing on actual metadata.
         save_backup (bool): Whether to save a backup of the original metadata Default is True. Set to False for testing on actual metadata.
         save_log_file (bool): Whether to update the log file. Default is True. Set to False for testing on actual metadata.
+        rate_per_minute (int): API request budget forwarded to get_works. Default is 600 (the OpenAlex polite-pool limit).
         verbose (bool): Whether to show detailed progress messages. Default is True.
 
     Returns:
@@ -28,6 +103,8 @@ def update_citations(
     """
     # Basic input validation
     file_path = os.path.expanduser(file_path) # Expand relative paths to absolute paths
+    # Sibling paths (backup, update log) are derived from this Path object.
+    metadata_path = Path(file_path)
     if not os.path.exists(file_path):
         return False, f"File not found: {file_path}"
     if not file_path.endswith('.csv'):
@@ -37,23 +114,23 @@ def update_citations(
     assert isinstance(save_log_file, bool), "save_log_file must be a boolean."
     assert isinstance(verbose, bool), "verbose must be a boolean."
 
-    # Read metadata file
+    # Read metadata file. Only the oaid column is needed to build the API
+    # request, so validate the header and load just that column here; the
+    # full file is read later, under the lock, for the write path.
     if verbose:
         print("Reading metadata file...")
     try:
-        metadata = pd.read_csv(file_path, dtype=str)
-        metadata["publication_date"] = pd.to_datetime(metadata["publication_date"])
-        metadata = metadata.sort_values(by="publication_date", ascending=False)
-        
+        header = pd.read_csv(file_path, nrows=0)
+
+        required_cols = ['oaid', 'cited_by_count', 'updated_date', 'doi_url']
+        if not all(col in header.columns for col in required_cols):
+            return False, f"Missing required columns: {set(required_cols) - set(header.columns)}"
+
+        metadata = pd.read_csv(file_path, usecols=["oaid"], dtype=str)
+
         if metadata.empty:
             return False, "Empty metadata file"
-        
-        required_cols = ['oaid', 'cited_by_count', 'updated_date', 'doi_url']
-        if not all(col in metadata.columns for col in required_cols):
-            return False, f"Missing required columns: {set(required_cols) - set(metadata.columns)}"
-            
-        metadata_backup = deepcopy(metadata)
-        
+
     except Exception as e:
         return False, f"Error reading metadata file: {str(e)}"
 
@@ -61,12 +138,11 @@ def update_citations(
     if verbose:
         print("Calling OpenAlex API ...")
     try:
-        valid_ids = []
-        for _, row in metadata.iterrows():
-            oaid = str(row['oaid'])
-            if pd.notna(oaid):
-                oaid_clean = oaid.split('/')[-1] if '/' in oaid else oaid
-                valid_ids.append(oaid_clean)
+        # Strip the URL prefix from every OAID in one vectorized pass
+        # instead of iterating row by row.
+        valid_ids = (
+            metadata["oaid"].dropna().astype(str).str.rsplit("/", n=1).str[-1].tolist()
+        )
 
         if not valid_ids:
             return False, "No valid OpenAlex IDs found"
@@ -74,93 +150,107 @@ def update_citations(
         works, failed_calls = get_works(
             ids=valid_ids,
             email=os.getenv("EMAIL"),
-            select_fields="id,doi,cited_by_count,updated_date",
+            select_fields=CITATION_FIELDS,
+            rate_per_minute=rate_per_minute,
             show_progress=verbose
         )
     except Exception as e:
         return False, f"API error: {str(e)}"
 
-    # Update citation counts
-    updated_count = 0
-    errors = []
+    # Nothing came back (e.g. the API is down): bail out before re-reading
+    # and rewriting the file for an empty update.
+    if not works:
+        return False, f"No works returned from the API; {len(failed_calls)} call(s) failed."
 
-    if verbose:
-        print("Updating citation counts...")
-    for idx, row in metadata.iterrows():
+    # Apply updates and save under the file lock. The metadata is re-read
+    # here so changes written by a concurrent append_metadata run between our
+    # initial read and this point are preserved.
+    with _METADATA_FILE_LOCK:
         try:
-            oaid = str(row["oaid"])
-            doi = row["doi_url"]
-            current_citations = int(row["cited_by_count"]) if pd.notna(row["cited_by_count"]) else 0
-            
-            work = next((w for w in works if w["metadata"]["id"] == oaid), None)
-            
-            if not work:
-                continue
-                
-            try:
-                new_citations = work["metadata"]["cited_by_count"]
-            except TypeError as e:
-                if verbose:
-                    print(f"TypeError: {e}")
-                    print(f"Work: {work}")
-                    print(f"Row type: {row['type']}")
-                continue
-
-            if new_citations > current_citations:
-                if verbose:
-                    print(f"Updating citations for OAID: {oaid} / DOI: {doi} from {current_citations} to {new_citations}")
-                metadata.at[idx, 'cited_by_count'] = str(new_citations)
-                metadata.at[idx, 'updated_date'] = work["metadata"]["updated_date"]
-                updated_count += 1
-            else:
-                if verbose:
-                    print(f"Citation count for OAID: {oaid} / DOI: {doi} is up-to-date. Citation count: {current_citations}. Skipping...")
-                    
+            metadata = _read_metadata_csv(file_path)
+            # The column holds ISO YYYY-MM-DD strings, whose lexicographic
+            # order is the chronological order — sorting needs no datetime
+            # conversion, and the column stays a plain string for the
+            # CSV rewrite below.
+            metadata = metadata.sort_values(by="publication_date", ascending=False, kind="stable")
         except Exception as e:
-            errors.append(f"Error processing {oaid}: {str(e)}")
-            if verbose:
-                print(f"Failed to update the cited_by_count for ID: {oaid}")
-                print(e)
-            continue
+            return False, f"Error re-reading metadata file: {str(e)}"
 
-    # Save updates if any were made
-    if updated_count > 0:
-        if save_metadata_to_disk:
-            if save_backup:
-                try:
-                    if verbose:
-                        print("Saving a backup of the original metadata file...")
-                    backup_timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-                    backup_path = file_path.replace(".csv", f"_bkp-{backup_timestamp}.csv")
-                    metadata_backup.to_csv(backup_path, index=False)
-                except Exception as e:
-                    return False, f"Error saving backup: {str(e)}"
+        # Update citation counts via a vectorized merge: matching works to
+        # rows is a single hash join instead of a linear scan over the works
+        # list for every metadata row.
+        updated_count = 0
+
+        if verbose:
+            print("Updating citation counts...")
+        works_df = pd.DataFrame([
+            {
+                "oaid": w["metadata"]["id"],
+                "new_cited_by_count": w["metadata"]["cited_by_count"],
+                "new_updated_date": w["metadata"].get("updated_date"),
+            }
+            for w in works
+            if isinstance(w["metadata"].get("cited_by_count"), int)
+        ])
+        if not works_df.empty:
+            works_df = works_df.drop_duplicates(subset="oaid")
+            merged = metadata.merge(works_df, on="oaid", how="left")
+            merged.index = metadata.index
+            current_citations = pd.to_numeric(merged["cited_by_count"], errors="coerce").fillna(0)
+            mask = merged["new_cited_by_count"] > current_citations
+            if mask.any():
+                if verbose:
+                    for oaid, doi in zip(merged.loc[mask, "oaid"], merged.loc[mask, "doi_url"]):
+                        print(f"Updating citations for OAID: {oaid} / DOI: {doi}")
+                metadata.loc[mask, "cited_by_count"] = merged.loc[mask, "new_cited_by_count"].astype(int).astype(str)
+                metadata.loc[mask, "updated_date"] = merged.loc[mask, "new_updated_date"]
+            updated_count = int(mask.sum())
+
+        # Save updates if any were made
+        if updated_count > 0:
+            if save_metadata_to_disk:
+                if save_backup:
+                    try:
+                        if verbose:
+                            print("Saving a backup of the original metadata file...")
+                        backup_timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+                        backup_path = metadata_path.with_name(
+                            f"{metadata_path.stem}_bkp-{backup_timestamp}{metadata_path.suffix}"
+                        )
+                        # Hardlink the untouched on-disk file where the
+                        # filesystem allows it — O(1), zero bytes moved. The
+                        # update write replaces the inode via os.replace, so
+                        # the link keeps the pre-update contents.
+                        try:
+                            os.link(file_path, backup_path)
+                        except OSError:
+                            shutil.copy2(file_path, backup_path)
+                    except Exception as e:
+                        return False, f"Error saving backup: {str(e)}"
 
-            if verbose:
-                print("Saving updated metadata to disk...")
-            try:
-                metadata.to_csv(file_path, index=False)
-            except Exception as e:
-                return False, f"Error saving updated metadata to disk: {str(e)}"
-            
-            if save_log_file:
                 if verbose:
-                    print("Updating the log file...")
+                    print("Saving updated metadata to disk...")
                 try:
-                    log_data = {
-                        "last_modified": datetime.now().strftime('%Y-%m-%d'),
-                        "status_message": f"Successfully updated citation counts for {updated_count} articles",
-                    }
-                    with open(os.path.join(os.path.dirname(file_path), "update-log.json"), 'w') as f:
-                        json.dump(log_data, f, indent=2)
+                    _write_metadata_csv(metadata, file_path)
                 except Exception as e:
-                    return False, f"Error updating log file: {str(e)}"
-        
-            return True, f"Successfully updated citation counts for {updated_count} articles and saved metadata to disk."
-        else: 
-            return True, f"Successfully updated citation counts for {updated_count} articles. No changes saved to disk."
-    else:
-        return True, "No updates made. Citation counts were up-to-date."
+                    return False, f"Error saving updated metadata to disk: {str(e)}"
+
+                if save_log_file:
+                    if verbose:
+                        print("Updating the log file...")
+                    try:
+                        _touch_log(
+                            metadata_path.with_name("update-log.json"),
+                            status_message=f"Successfully updated citation counts for {updated_count} articles",
+                        )
+                    except Exception as e:
+                        return False, f"Error updating log file: {str(e)}"
+
+                return True, f"Successfully updated citation counts for {updated_count} articles and saved metadata to disk."
+            else:
+                return True, f"Successfully updated citation counts for {updated_count} articles. No changes saved to disk."
+        else:
+            return True, "No updates made. Citation counts were up-to-date."
 
 from typing import List, Dict, Any
 
@@ -199,57 +289,6 @@ def parse_data(works: List[Dict[str, Any]], exclude_errata: bool = True) -> pd.D
         - Updated date (from the API)
     """
 
-    # Initialize an empty list to store the extracted data, and iterate over the works data to extract relevant information
-    oa_data = []
-    for work in works:
-        metadata = work["metadata"]
-        # Skip errata up front when caller asked us to exclude them — avoids
-        # parsing rows we're going to drop, and dodges missing-field crashes
-        # (errata don't have cited_by_api_url in OpenAlex).
-        if exclude_errata and metadata.get("type") == "erratum":
-            continue
-        first_author_last_name = metadata["authorships"][0]["author"]["display_name"].split(" ")[-1]
-        article_title = metadata["title"]
-        journal = metadata["primary_location"]["source"]["display_name"]
-        publication_year = str(metadata["publication_year"])
-        publication_date = metadata["publication_date"]
-        if publication_date:
-            try:
-                publication_date = pd.to_datetime(publication_date).strftime('%Y-%m-%d')
-            except ValueError:
-                pass # If the date can't be parsed, keep the original string
-        pmid = metadata["ids"].get("pmid", "").split("/")[-1] # To remove the url prefix
-        pmcid = metadata["ids"].get("pmcid")
-        if pmcid is not None:
-            pmcid = pmcid.split("/")[-1] # To remove the url prefix
-        else: 
-            pmcid = "" # To replace None with an empty string
-        oaid = metadata["id"]
-        try:
-            pdf_url = metadata.get("best_oa_location", {}).get("pdf_url", "not available")
-        except AttributeError:
-            pdf_url = "not available"
-        if pdf_url is None:
-            pdf_url = "not available"
-        doi_url = metadata["doi"]
-        cited_by_count = str(metadata["cited_by_count"])
-        # Derive the UI URL from the OAID rather than the API's cited_by_api_url field.
-        # OpenAlex omits cited_by_api_url for new/low-citation works and some
-        # record types (errata, retractions); the URL pattern is deterministic,
-        # so deriving is more reliable and produces the same string for records
-        # where the API does populate the field.
-        oaid_short = oaid.split("/")[-1] if oaid else ""
-        cited_by_ui_url = f"https://openalex.org/works?filter=cites:{oaid_short}" if oaid_short else ""
-        work_type = metadata.get("type")
-        type_crossref = metadata.get("type_crossref")
-        updated_date = metadata.get("updated_date")
-
-        oa_data.append([
-            first_author_last_name, article_title, journal, publication_year,
-            publication_date, pmid, pmcid, oaid, pdf_url, doi_url,
-            cited_by_count, cited_by_ui_url, work_type, type_crossref, updated_date
-        ])
-
     columns = [
         'first_author_last_name', 'article_title', 'journal',
         'publication_year', 'publication_date', 'pmid', 'pmcid', 'oaid',
@@ -257,16 +296,84 @@ def parse_data(works: List[Dict[str, Any]], exclude_errata: bool = True) -> pd.D
         'type_crossref', 'updated_date'
     ]
 
-    # Create a DataFrame with the specified columns
-    df_works = pd.DataFrame(oa_data, columns=columns, dtype=str)
+    # Skip errata (when excluded) and duplicate OpenAlex IDs up front —
+    # avoids flattening rows we would drop anyway, and dodges missing-field
+    # crashes (errata lack several fields in OpenAlex). Lookups across PMIDs
+    # can return the same work more than once.
+    seen_oaids: Set[str] = set()
+    metas = []
+    for work in works:
+        metadata = work["metadata"]
+        if exclude_errata and metadata.get("type") == "erratum":
+            continue
+        oaid = metadata.get("id")
+        if oaid in seen_oaids:
+            continue
+        seen_oaids.add(oaid)
+        metas.append(metadata)
+    if not metas:
+        return pd.DataFrame(columns=columns)
+
+    # Flatten the nested API payloads once and derive the columns with
+    # vectorized string operations instead of ~15 dict lookups per work.
+    flat = pd.json_normalize(metas, sep=".")
+
+    def _col(name: str) -> pd.Series:
+        """Return a flattened column, or an all-None series when absent."""
+        if name in flat.columns:
+            return flat[name]
+        return pd.Series([None] * len(flat), index=flat.index, dtype=object)
+
+    df_works = pd.DataFrame(index=flat.index)
+    # authorships is a list, which json_normalize does not expand; pick the
+    # first author per row, then split off the last name vectorized.
+    first_authors = pd.Series(
+        [metadata["authorships"][0]["author"]["display_name"] for metadata in metas],
+        index=flat.index,
+    )
+    df_works["first_author_last_name"] = first_authors.str.rsplit(" ", n=1).str[-1]
+    df_works["article_title"] = _col("title")
+    df_works["journal"] = _col("primary_location.source.display_name")
+    df_works["publication_year"] = _col("publication_year").astype(str)
+    df_works["publication_date"] = _col("publication_date")
+    # Strip the url prefix from PMIDs/PMCIDs, replacing missing ones with "".
+    df_works["pmid"] = _col("ids.pmid").fillna("").str.split("/").str[-1]
+    df_works["pmcid"] = _col("ids.pmcid").fillna("").str.split("/").str[-1]
+    df_works["oaid"] = _col("id")
+    df_works["pdf_url"] = _col("best_oa_location.pdf_url").fillna("not available")
+    df_works["doi_url"] = _col("doi")
+    df_works["cited_by_count"] = _col("cited_by_count").astype(str)
+    # Derive the UI URL from the OAID rather than the API's cited_by_api_url field.
+    # OpenAlex omits cited_by_api_url for new/low-citation works and some
+    # record types (errata, retractions); the URL pattern is deterministic,
+    # so deriving is more reliable and produces the same string for records
+    # where the API does populate the field.
+    oaid_short = _col("id").fillna("").str.split("/").str[-1]
+    df_works["cited_by_ui_url"] = (
+        "https://openalex.org/works?filter=cites:" + oaid_short
+    ).where(oaid_short != "", "")
+    df_works["type"] = _col("type")
+    df_works["type_crossref"] = _col("type_crossref")
+    df_works["updated_date"] = _col("updated_date")
+
+    # Arrow-backed strings hash in vectorized C code, so deduplication skips
+    # per-cell PyObject hashing; harmless to skip when pyarrow is missing.
+    try:
+        df_works["pmid"] = df_works["pmid"].astype("string[pyarrow]")
+    except (ImportError, TypeError):
+        pass
     df_works = df_works.drop_duplicates(subset=["pmid"])
-    if exclude_errata:
-        df_works = df_works[df_works["type"] != "erratum"]
 
-    # Parse the publication date as a datetime object with the format 'YYYY-MM-DD'
-    df_works["publication_date"] = pd.to_datetime(df_works["publication_date"], errors='coerce').dt.strftime('%Y-%m-%d')
-    
-    # Sort the DataFrame by publication date in descending order
+    # OpenAlex already returns publication_date as YYYY-MM-DD, so validating
+    # with a regex is enough — no need to build datetime objects just to
+    # format them back into the same string. Anything malformed becomes NaN,
+    # matching the old errors='coerce' behavior.
+    df_works["publication_date"] = df_works["publication_date"].where(
+        df_works["publication_date"].str.match(r"^\d{4}-\d{2}-\d{2}$", na=False)
+    )
+
+    # Sort by publication date in descending order; for ISO dates the
+    # lexicographic string order is the chronological order.
     df_works = df_works.sort_values(by="publication_date", ascending=False)
     df_works.reset_index(drop=True, inplace=True)
 
@@ -276,9 +383,8 @@ import os
 import pandas as pd
 from datetime import datetime
 import argparse
-from copy import deepcopy
 
-def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata: bool = True, verbose: bool = True) -> Tuple[bool, str]:
+def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata: bool = True, rate_per_minute: int = 600, verbose: bool = True) -> Tuple[bool, str]:
     """
     Append metadata for missing PMIDs to an existing metadata file.
 
@@ -286,6 +392,7 @@ def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata
         metadata_file_path (str): Path to CSV file containing existing metadata.
         pmid_file_path (str): Path to file containing list of PMIDs.
         exclude_errata (bool): Whether to exclude errata from the metadata.
+        rate_per_minute (int): API request budget forwarded to get_works. Default is 600 (the OpenAlex polite-pool limit).
         verbose (bool): Whether to show verbose messages during the process.
 
     Returns:
@@ -299,11 +406,15 @@ def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata
     assert os.path.exists(pmid_file_path), "PMID file not found."
     assert isinstance(verbose, bool), "Verbose must be a boolean."
 
-    # Read existing metadata
+    # Sibling paths (backup, update log) are derived from this Path object.
+    metadata_path = Path(metadata_file_path)
+
+    # Read existing metadata. Only the pmid column is needed to decide which
+    # PMIDs are new; the full file is read later, under the lock, when there
+    # is actually something to append.
     if verbose: print("Reading the existing metadata file...")
     try:
-        metadata = pd.read_csv(metadata_file_path, dtype=str)
-        metadata_bkp = deepcopy(metadata) # Make a deepcopy of the DataFrame to save a backup
+        existing_metadata_pmids = pd.read_csv(metadata_file_path, usecols=["pmid"], dtype=str)
     except Exception as e:
         if verbose:
             print(f"An error occurred while reading the metadata file: {e}")
@@ -313,18 +424,22 @@ def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata
     if verbose: print("Reading the PMID file...")
     try:
         with open(pmid_file_path, 'r') as f:
-            pmids = set(line.strip() for line in f)
+            pmids = {line.rstrip("\n") for line in f}
+        pmids.discard("")  # Ignore blank lines (e.g. a trailing newline)
     except Exception as e:
         if verbose:
             print(f"An error occurred while reading the PMID file: {e}")
         return False, f"An error occurred while reading the PMID file: {e}"
 
-    # Find missing PMIDs
+    # Find missing PMIDs. Index.difference runs the set operation on the
+    # hash-table index pandas already built for the pmid column, rather
+    # than materializing both sides as Python sets first.
     if verbose: print("Searching for new PMIDs not in the metadata...")
-    existing_pmids: Set[str] = set(metadata["pmid"])
-    new_pmids: Set[str] = pmids - existing_pmids
-    new_pmids_str = ", ".join(new_pmids) # Convert to a string with comma-separated values
-    if verbose: print(f"Found {len(new_pmids)} new PMID(s): {new_pmids_str}.")
+    existing_pmids = pd.Index(existing_metadata_pmids["pmid"].dropna())
+    new_pmids = pd.Index(sorted(pmids)).difference(existing_pmids)
+    if verbose:
+        # Only build the comma-separated listing when it will be printed.
+        print(f"Found {len(new_pmids)} new PMID(s): {', '.join(new_pmids)}.")
     if len(new_pmids) == 0:
         # Nothing to do is a successful no-op, not a failure.
         return True, "No new PMIDs found."
@@ -340,6 +455,7 @@ def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata
                 ids=list(new_pmids),
                 email=os.environ.get("EMAIL"),
                 select_fields=select_fields,
+                rate_per_minute=rate_per_minute,
                 show_progress=verbose
             )
             if verbose: print(f"API calls completed. Failed calls: {len(failed_calls)}")
@@ -367,43 +483,46 @@ def append_metadata(metadata_file_path: str, pmid_file_path: str, exclude_errata
                 if verbose: print("No new articles found.")
                 return True, "No new articles found."
         else:
-            # Append the new articles to the existing metadata
-            new_pmids = set(df_new_articles["pmid"])
-            new_pmids = ", ".join(new_pmids) # Convert to a string with comma-separated values
-            if verbose: print(f"Appending {len(df_new_articles)} new article(s) with PMID(s) {new_pmids} to the existing metadata...")
-            try:
-                metadata = pd.concat([df_new_articles, metadata], ignore_index=True)
-            except Exception as e:
+            # Append the new articles to the existing metadata and save under
+            # the file lock. The metadata is re-read here so changes written
+            # by a concurrent update_citations run are preserved.
+            with _METADATA_FILE_LOCK:
                 if verbose:
-                    print(f"An error occurred while appending the new articles to the existing metadata: {e}")
-                return False, f"An error occurred while appending the new articles to the existing metadata: {e}"
-
-            # Save the updated metadata to a CSV file
-            if verbose: print("Saving the updated metadata to a CSV file...")
-            metadata.to_csv(metadata_file_path, index=False)
-            if verbose: print("Saving a backup file to disk...")
-            bkp_file_path = metadata_file_path.replace(".csv", f"_bkp-{datetime.now().strftime('%Y%m%d-%Hh%Mm')}.csv")
-            metadata_bkp.to_csv(bkp_file_path, index=False)
-            if verbose: print("Metadata updated successfully.")
-
-            # Get the path to the log file from the metadata file path
-            log_file_path = os.path.join(os.path.dirname(metadata_file_path), "update-log.json")
-            
-            # Update the log file
-            try:
+                    appended_pmids_str = ", ".join(set(df_new_articles["pmid"]))
+                    print(f"Appending {len(df_new_articles)} new article(s) with PMID(s) {appended_pmids_str} to the existing metadata...")
+                try:
+                    metadata = _read_metadata_csv(metadata_file_path)
+                    # Align the new rows to the on-disk column order and
+                    # dtypes so concat takes the same-dtype fast path rather
+                    # than falling back to per-cell object coercion.
+                    df_new_articles = df_new_articles.reindex(columns=metadata.columns)
+                    df_new_articles = df_new_articles.astype(metadata.dtypes.to_dict())
+                    metadata = pd.concat([df_new_articles, metadata], ignore_index=True)
+                except Exception as e:
+                    if verbose:
+                        print(f"An error occurred while appending the new articles to the existing metadata: {e}")
+                    return False, f"An error occurred while appending the new articles to the existing metadata: {e}"
+
+                # Back up the pre-append state by copying the untouched
+                # on-disk file, then overwrite it with the updated metadata.
+                if verbose: print("Saving a backup file to disk...")
+                bkp_file_path = metadata_path.with_name(
+                    f"{metadata_path.stem}_bkp-{datetime.now().strftime('%Y%m%d-%Hh%Mm')}{metadata_path.suffix}"
+                )
+                # Hardlink where possible (O(1)); the rewrite below replaces
+                # the inode, so the link keeps the pre-append contents.
+                try:
+                    os.link(metadata_file_path, bkp_file_path)
+                except OSError:
+                    shutil.copy2(metadata_file_path, bkp_file_path)
+                if verbose: print("Saving the updated metadata to a CSV file...")
+                _write_metadata_csv(metadata, metadata_file_path)
+                if verbose: print("Metadata updated successfully.")
+
+                # Update the log file. _touch_log writes the whole payload
+                # atomically, so there is no separate create-if-missing path.
                 if verbose: print("Updating the log file...")
-                with open(log_file_path, "r") as f:
-                    update_log = json.load(f)
-                current_date = datetime.now().strftime("%Y-%m-%d")    
-                update_log["last_modified"] = current_date # Expected format: {"last_modified": "2024-08-06"}
-                with open(log_file_path, "w") as f:
-                    json.dump(update_log, f)
-                if verbose: print(f"Log file updated successfully.")
-            except Exception as e:
-                if verbose: print(f"Error updating log file: {e}. Creating a new log file...")
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                with open(log_file_path, "w") as f:
-                    json.dump({"last_modified": current_date}, f)
-                if verbose: print(f"New log file created successfully.")
-
-            return True, f"Appended {len(df_new_articles)} article(s) and saved file to {metadata_file_path}. Backup saved as {bkp_file_path}"
+                _touch_log(metadata_path.with_name("update-log.json"))
+                if verbose: print("Log file updated successfully.")
+
+                return True, f"Appended {len(df_new_articles)} article(s) and saved file to {metadata_file_path}. Backup saved as {bkp_file_path}"